@@ -7,6 +7,7 @@ for the GSAF5 shark attacks dataset.
 
 from .cleaning import (
     clean_data,
+    load_cleaned,
     remove_empty_columns,
     remove_duplicates,
     clean_sex_column,
@@ -17,10 +18,12 @@ from .cleaning import (
     clean_activity_column,
     clean_species_column,
     parse_dates,
-    handle_missing_values
+    handle_missing_values,
+    optimize_dtypes
 )
 
 from .analysis import (
+    AnalysisContext,
     analyze_geographic_hotspots,
     analyze_activity_risk,
     analyze_gender_disparity,
@@ -42,12 +45,14 @@ from .visualization import (
     plot_age_distribution,
     plot_fatality_analysis,
     plot_risk_score,
+    render_all,
     set_plot_style
 )
 
 __all__ = [
     # Cleaning functions
     'clean_data',
+    'load_cleaned',
     'remove_empty_columns',
     'remove_duplicates',
     'clean_sex_column',
@@ -59,7 +64,9 @@ __all__ = [
     'clean_species_column',
     'parse_dates',
     'handle_missing_values',
+    'optimize_dtypes',
     # Analysis functions
+    'AnalysisContext',
     'analyze_geographic_hotspots',
     'analyze_activity_risk',
     'analyze_gender_disparity',
@@ -79,6 +86,7 @@ __all__ = [
     'plot_age_distribution',
     'plot_fatality_analysis',
     'plot_risk_score',
+    'render_all',
     'set_plot_style'
 ]
 
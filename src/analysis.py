@@ -3,22 +3,118 @@ Analysis functions for Shark Attacks dataset.
 This module provides reusable analysis functions for hypothesis testing and insights.
 """
 
+from functools import cached_property
+
 import pandas as pd
 import numpy as np
 
 
-def analyze_geographic_hotspots(df, top_n=10):
+def _contains(series, pattern):
+    """
+    Case-insensitive substring match over a text column.
+
+    For categorical columns only the categories are scanned and the result is
+    broadcast back to the rows through the category codes.
+
+    Args:
+        series (pd.Series): Text or categorical column
+        pattern (str): Substring to look for
+
+    Returns:
+        pd.Series: Boolean mask aligned with the input series
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        matches = np.asarray(series.cat.categories.str.contains(pattern, case=False, regex=False), dtype=bool)
+        # Code -1 (missing) picks the trailing False
+        matches = np.append(matches, False)
+        return pd.Series(matches[series.cat.codes.to_numpy()], index=series.index)
+
+    return series.astype('string').str.contains(pattern, case=False, regex=False, na=False).astype(bool)
+
+
+class AnalysisContext:
+    """
+    Shared intermediate results for the analysis functions.
+
+    Several analysis functions need the same aggregates (e.g. country counts or
+    the fatal mask). A context computes each one lazily, at most once, so
+    passing the same context to multiple functions avoids repeated passes
+    over the dataframe.
+
+    Attributes:
+        df (pd.DataFrame): The dataframe being analyzed
+    """
+
+    def __init__(self, df):
+        """
+        Initialize the context for a dataframe.
+
+        Args:
+            df (pd.DataFrame): Cleaned shark attacks dataframe
+        """
+        self.df = df
+
+    @cached_property
+    def country_counts(self):
+        """pd.Series: Attack counts per country, descending."""
+        return self.df['Country'].value_counts()
+
+    @cached_property
+    def activity_counts(self):
+        """pd.Series: Attack counts per activity, descending."""
+        return self.df['Activity'].value_counts()
+
+    @cached_property
+    def sex_counts(self):
+        """pd.Series: Attack counts per sex, descending."""
+        return self.df['Sex'].value_counts()
+
+    @cached_property
+    def fatal_counts(self):
+        """pd.Series: Counts of fatal (Y) and non-fatal (N) attacks."""
+        return self.df['Fatal Y/N'].value_counts()
+
+    @cached_property
+    def is_fatal(self):
+        """pd.Series: Boolean mask of fatal attacks."""
+        return self.df['Fatal Y/N'] == 'Y'
+
+
+def _get_context(df, ctx):
+    """
+    Return the analysis context for df, creating one if none was passed.
+
+    Args:
+        df (pd.DataFrame): Dataframe being analyzed
+        ctx (AnalysisContext, optional): Context passed by the caller
+
+    Returns:
+        AnalysisContext: Context built from df
+
+    Raises:
+        ValueError: If ctx was built from a different dataframe
+    """
+    if ctx is None:
+        return AnalysisContext(df)
+    if ctx.df is not df:
+        raise ValueError("ctx was built from a different dataframe than df")
+    return ctx
+
+
+def analyze_geographic_hotspots(df, top_n=10, ctx=None):
     """
     Analyze geographic distribution of shark attacks.
 
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
         top_n (int): Number of top countries to return
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         dict: Dictionary containing analysis results
     """
-    top_countries = df['Country'].value_counts().head(top_n)
+    ctx = _get_context(df, ctx)
+    top_countries = ctx.country_counts.head(top_n)
     top3_total = top_countries.head(3).sum()
     top3_percentage = (top3_total / len(df)) * 100
 
@@ -29,50 +125,53 @@ def analyze_geographic_hotspots(df, top_n=10):
     }
 
 
-def analyze_activity_risk(df, top_n=10):
+def analyze_activity_risk(df, top_n=10, ctx=None):
     """
     Analyze which activities have the highest shark attack rates.
 
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
         top_n (int): Number of top activities to return
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         dict: Dictionary containing analysis results
     """
-    top_activities = df['Activity'].value_counts().head(top_n)
+    ctx = _get_context(df, ctx)
+    top_activities = ctx.activity_counts.head(top_n)
 
     # Calculate surfing + swimming percentage
-    surfing_swimming = df[df['Activity'].str.contains('Surfing|Swimming', case=False, na=False)]
-    activity_percentage = (len(surfing_swimming) / len(df)) * 100
+    surfing = _contains(df['Activity'], 'Surfing')
+    swimming = _contains(df['Activity'], 'Swimming')
+    activity_percentage = ((surfing | swimming).sum() / len(df)) * 100
 
     return {
         'top_activities': top_activities,
         'surfing_swimming_pct': activity_percentage,
-        'surfing_count': len(df[df['Activity'].str.contains('Surfing', case=False, na=False)]),
-        'swimming_count': len(df[df['Activity'].str.contains('Swimming', case=False, na=False)])
+        'surfing_count': int(surfing.sum()),
+        'swimming_count': int(swimming.sum())
     }
 
 
-def analyze_gender_disparity(df):
+def analyze_gender_disparity(df, ctx=None):
     """
     Analyze gender distribution in shark attacks.
 
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         dict: Dictionary containing analysis results
     """
-    gender_counts = df['Sex'].value_counts()
+    ctx = _get_context(df, ctx)
+    gender_counts = ctx.sex_counts
     male_count = gender_counts.get('M', 0)
     female_count = gender_counts.get('F', 0)
     ratio = male_count / female_count if female_count > 0 else 0
 
     # Fatality rate by gender
-    fatal_by_gender = df.groupby('Sex')['Fatal Y/N'].apply(
-        lambda x: (x == 'Y').sum() / len(x) * 100
-    )
+    fatal_by_gender = ctx.is_fatal.groupby(df['Sex'], observed=True).mean() * 100
 
     return {
         'gender_counts': gender_counts,
@@ -95,19 +194,18 @@ def analyze_temporal_trends(df, start_year=1900, end_year=2025):
     Returns:
         dict: Dictionary containing analysis results
     """
-    # Filter for valid years
-    df_temporal = df[df['Year'].notna() &
-                     (df['Year'] >= start_year) &
-                     (df['Year'] <= end_year)].copy()
+    # Filter for valid years (NaN compares False, so missing years drop out)
+    years = pd.to_numeric(df['Year'], errors='coerce').to_numpy()
+    years = years[(years >= start_year) & (years <= end_year)]
 
     # Attacks by decade
-    df_temporal['Decade'] = (df_temporal['Year'] // 10) * 10
-    attacks_by_decade = df_temporal['Decade'].value_counts().sort_index()
+    decades, decade_counts = np.unique((years // 10) * 10, return_counts=True)
+    attacks_by_decade = pd.Series(decade_counts, index=pd.Index(decades, name='Decade'), name='count')
 
     # Attacks by year (recent 50 years)
     recent_cutoff = end_year - 50
-    recent_years = df_temporal[df_temporal['Year'] >= recent_cutoff]
-    attacks_by_year = recent_years.groupby('Year').size()
+    recent_years, year_counts = np.unique(years[years >= recent_cutoff], return_counts=True)
+    attacks_by_year = pd.Series(year_counts, index=pd.Index(recent_years, name='Year'))
 
     # Calculate trend
     early_avg = attacks_by_decade.iloc[:5].mean() if len(attacks_by_decade) >= 5 else 0
@@ -134,8 +232,7 @@ def analyze_species(df, top_n=10):
     Returns:
         pd.Series: Top species by attack count
     """
-    species_col = 'Species ' if 'Species ' in df.columns else 'Species'
-    top_species = df[species_col].value_counts().head(top_n)
+    top_species = df['Species'].value_counts().head(top_n)
     return top_species
 
 
@@ -160,25 +257,29 @@ def analyze_age_distribution(df):
     }
 
 
-def analyze_fatality_rates(df, top_n_countries=5):
+def analyze_fatality_rates(df, top_n_countries=5, ctx=None):
     """
     Analyze fatality rates overall and by country.
 
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
         top_n_countries (int): Number of top countries to analyze
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         dict: Dictionary containing fatality analysis
     """
-    fatal_counts = df['Fatal Y/N'].value_counts()
+    ctx = _get_context(df, ctx)
+    fatal_counts = ctx.fatal_counts
     total_with_data = fatal_counts.sum()
     fatality_rate = (fatal_counts.get('Y', 0) / total_with_data) * 100 if total_with_data > 0 else 0
 
     # Fatality by country (top N)
-    top_countries_list = df['Country'].value_counts().head(top_n_countries).index
-    fatality_by_country = df[df['Country'].isin(top_countries_list)].groupby('Country')['Fatal Y/N'].apply(
-        lambda x: (x == 'Y').sum() / len(x) * 100 if len(x) > 0 else 0
+    top_countries_list = ctx.country_counts.head(top_n_countries).index
+    in_top = df['Country'].isin(top_countries_list)
+    is_fatal = ctx.is_fatal[in_top]
+    fatality_by_country = (
+        is_fatal.groupby(df.loc[in_top, 'Country'], observed=True, sort=False).mean() * 100
     ).sort_values(ascending=False)
 
     return {
@@ -188,7 +289,7 @@ def analyze_fatality_rates(df, top_n_countries=5):
     }
 
 
-def calculate_surf_risk_score(df, min_attacks=10):
+def calculate_surf_risk_score(df, min_attacks=10, ctx=None):
     """
     Calculate risk scores for surfing locations by country.
     Risk score combines attack frequency and fatality rate.
@@ -196,19 +297,23 @@ def calculate_surf_risk_score(df, min_attacks=10):
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
         min_attacks (int): Minimum number of attacks for statistical relevance
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         pd.DataFrame: Countries with risk scores (sorted by risk)
     """
+    ctx = _get_context(df, ctx)
+
     # Filter for surfing-related activities
-    df_surfing = df[df['Activity'].str.contains('Surf', case=False, na=False)]
+    is_surfing = _contains(df['Activity'], 'Surf')
+    df_surfing = df[is_surfing]
 
     # Calculate attacks and fatality rate by country
-    surf_by_country = df_surfing.groupby('Country').agg({
-        'Fatal Y/N': ['count', lambda x: (x == 'Y').sum() / len(x) * 100 if len(x) > 0 else 0]
-    }).round(2)
-
-    surf_by_country.columns = ['Attack_Count', 'Fatality_Rate']
+    surf_by_country = df_surfing.assign(_fatal=ctx.is_fatal[is_surfing]).groupby('Country', observed=True, sort=False).agg(
+        Attack_Count=('Fatal Y/N', 'count'),
+        Fatality_Rate=('_fatal', 'mean')
+    )
+    surf_by_country['Fatality_Rate'] *= 100
 
     # Filter for statistical relevance
     surf_by_country = surf_by_country[surf_by_country['Attack_Count'] >= min_attacks]
@@ -216,27 +321,29 @@ def calculate_surf_risk_score(df, min_attacks=10):
     # Calculate risk score (lower is better)
     # Formula: (normalized attack count * 50) + fatality rate
     max_attacks = surf_by_country['Attack_Count'].max()
-    surf_by_country['Risk_Score'] = (
-        (surf_by_country['Attack_Count'] / max_attacks * 50) +
-        (surf_by_country['Fatality_Rate'])
-    ).round(2)
+    surf_by_country = surf_by_country.assign(
+        Risk_Score=(surf_by_country['Attack_Count'] / max_attacks * 50) + surf_by_country['Fatality_Rate']
+    )
 
-    # Sort by risk score
-    surf_by_country = surf_by_country.sort_values('Risk_Score')
+    # Sort by risk score and round only the rows that are returned
+    surf_by_country = surf_by_country.sort_values('Risk_Score').round(2)
 
     return surf_by_country
 
 
-def get_summary_statistics(df):
+def get_summary_statistics(df, ctx=None):
     """
     Get overall summary statistics for the dataset.
 
     Args:
         df (pd.DataFrame): Cleaned shark attacks dataframe
+        ctx (AnalysisContext, optional): Shared intermediates for df
 
     Returns:
         dict: Dictionary containing summary statistics
     """
+    ctx = _get_context(df, ctx)
+
     return {
         'total_attacks': len(df),
         'date_range': (df['Year'].min(), df['Year'].max()),
@@ -244,7 +351,7 @@ def get_summary_statistics(df):
         'activities_count': df['Activity'].nunique(),
         'avg_age': df['Age'].mean(),
         'median_age': df['Age'].median(),
-        'overall_fatality_rate': (df['Fatal Y/N'] == 'Y').sum() / len(df) * 100
+        'overall_fatality_rate': ctx.is_fatal.sum() / len(df) * 100
     }
 
 
@@ -258,9 +365,11 @@ def validate_all_hypotheses(df):
     Returns:
         dict: Dictionary containing all hypothesis test results
     """
-    h1 = analyze_geographic_hotspots(df)
-    h2 = analyze_activity_risk(df)
-    h3 = analyze_gender_disparity(df)
+    ctx = AnalysisContext(df)
+
+    h1 = analyze_geographic_hotspots(df, ctx=ctx)
+    h2 = analyze_activity_risk(df, ctx=ctx)
+    h3 = analyze_gender_disparity(df, ctx=ctx)
     h4 = analyze_temporal_trends(df)
 
     return {
@@ -268,5 +377,5 @@ def validate_all_hypotheses(df):
         'h2_activity': h2,
         'h3_gender': h3,
         'h4_temporal': h4,
-        'summary': get_summary_statistics(df)
+        'summary': get_summary_statistics(df, ctx=ctx)
     }
@@ -6,8 +6,208 @@ This module provides modular cleaning functionality for the GSAF5 dataset.
 import pandas as pd
 import numpy as np
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Compiled regex patterns shared by the cleaning steps
+_AGE_NUM_RE = re.compile(r'(\d+)')
+_DATE_RE = re.compile(r'(?P<day>\d{1,2})(?:st|nd|rd|th)?\s+(?P<month>[A-Za-z]+)')
+
+
+
+def _map_categories(series, mapping, allowed=None):
+    """
+    Map values of a text column through a dict, operating on its categories.
+
+    The mapping is applied once per distinct value instead of once per row.
+    Values missing from the mapping are kept; values mapped to NaN become NaN.
+
+    Args:
+        series (pd.Series): Column to remap
+        mapping (dict): Mapping from raw to standardized values
+        allowed (iterable, optional): If given, any mapped value outside this
+            set becomes NaN
+
+    Returns:
+        pd.Series: Categorical series with the mapping applied
+    """
+    series = series.astype('category')
+    mapped = series.cat.categories.map(lambda value: mapping.get(value, value))
+
+    if allowed is not None:
+        mapped = mapped.where(mapped.isin(allowed))
+
+    # Several raw values may map to the same standard value, so re-factorize
+    new_codes, new_categories = pd.factorize(mapped)
+    # Trailing -1 sentinel so missing values (code -1) stay missing, even
+    # when there are no categories at all
+    new_codes = np.append(new_codes, -1)
+    codes = new_codes[series.cat.codes.to_numpy()]
+
+    return pd.Series(pd.Categorical.from_codes(codes, categories=new_categories),
+                     index=series.index, name=series.name)
+
+
+def _clean_sex_series(sex):
+    """Standardize a Sex series to contain only 'M', 'F', or NaN."""
+    # Strip whitespace and convert to uppercase
+    sex = sex.astype('string[pyarrow]').str.strip().str.upper()
+
+    # Map variations to standard values
+    sex_mapping = {
+        'M': 'M',
+        'F': 'F',
+        'MALE': 'M',
+        'FEMALE': 'F',
+        'N': np.nan,
+        'NAN': np.nan,
+        '.': np.nan,
+        '': np.nan
+    }
+
+    # Set anything not M or F to NaN
+    return _map_categories(sex, sex_mapping, allowed=('M', 'F'))
+
+
+def _clean_fatal_series(fatal):
+    """Standardize a Fatal Y/N series to contain only 'Y', 'N', or NaN."""
+    # Strip whitespace and convert to uppercase
+    fatal = fatal.astype('string[pyarrow]').str.strip().str.upper()
+
+    # Map variations to standard values
+    fatal_mapping = {
+        'Y': 'Y',
+        'N': 'N',
+        'YES': 'Y',
+        'NO': 'N',
+        'F': 'Y',  # F might mean Fatal
+        'M': np.nan,
+        'UNKNOWN': np.nan,
+        'NAN': np.nan,
+        '': np.nan,
+        '2017': np.nan  # Sometimes has erroneous data
+    }
+
+    # Set anything not Y or N to NaN
+    return _map_categories(fatal, fatal_mapping, allowed=('Y', 'N'))
+
+
+def _clean_type_series(attack_type):
+    """Standardize a Type series (Unprovoked, Provoked, etc.)."""
+    # Strip whitespace
+    attack_type = attack_type.astype('string[pyarrow]').str.strip()
+
+    # Replace 'Invalid' or 'Questionable' with NaN
+    return attack_type.mask(attack_type.isin(['Invalid', 'Questionable', 'Unconfirmed', 'Unverified']))
+
+
+def _clean_age_series(age):
+    """Convert an Age series with mixed formats to numeric values."""
+    age_str = age.astype('string[pyarrow]').str.strip().str.lower()
+
+    # Extract first number found and validate reasonable age range
+    numbers = pd.to_numeric(age_str.str.extract(_AGE_NUM_RE, expand=False), errors='coerce')
+    numbers = numbers.where((numbers > 0) & (numbers < 120))
+
+    # Handle text descriptions
+    age_text_mapping = {
+        'teen': 15,
+        'teenager': 15,
+        'adult': 30,
+        'child': 8,
+        'boy': 10,
+        'girl': 10,
+        'young': 25,
+        'elderly': 70,
+        'middle': 45
+    }
+
+    # Iterate in reverse so the first matching keyword takes precedence
+    text_ages = pd.Series(np.nan, index=age_str.index)
+    for key, value in reversed(age_text_mapping.items()):
+        text_ages = text_ages.mask(age_str.str.contains(key, regex=False, na=False), value)
+
+    return numbers.fillna(text_ages).astype('float32')
+
+
+def _clean_country_series(country):
+    """Standardize country names and fix common inconsistencies."""
+    # Strip whitespace and standardize case
+    country = country.astype('string[pyarrow]').str.strip().str.upper()
+
+    # Common country name standardizations
+    country_mapping = {
+        'USA': 'USA',
+        'UNITED STATES': 'USA',
+        'UNITED STATES OF AMERICA': 'USA',
+        'US': 'USA',
+        'AUSTRALIA': 'AUSTRALIA',
+        'SOUTH AFRICA': 'SOUTH AFRICA',
+        'RSA': 'SOUTH AFRICA',
+        'REPUBLIC OF SOUTH AFRICA': 'SOUTH AFRICA',
+        'ENGLAND': 'UNITED KINGDOM',
+        'SCOTLAND': 'UNITED KINGDOM',
+        'WALES': 'UNITED KINGDOM',
+        'UK': 'UNITED KINGDOM'
+    }
+
+    # Replace 'NAN' string with actual NaN
+    country_mapping['NAN'] = np.nan
+
+    return _map_categories(country, country_mapping)
+
+
+def _clean_activity_series(activity):
+    """Standardize activity descriptions."""
+    # Strip whitespace and standardize case
+    activity = activity.astype('string[pyarrow]').str.strip().str.title()
+
+    # Replace 'Nan' with actual NaN
+    return activity.mask(activity.str.lower() == 'nan')
+
+
+def _clean_species_series(species):
+    """Clean and standardize shark species information."""
+    # Strip whitespace
+    species = species.astype('string[pyarrow]').str.strip()
+
+    # Replace invalid/unknown markers with NaN
+    invalid_markers = [
+        'Invalid', 'Unknown', 'Not stated', 'Unconfirmed',
+        'Shark involvement not confirmed',
+        'Shark involvement prior to death was not confirmed',
+        'No shark involvement', 'Questionable', 'nan'
+    ]
+
+    # Standardize common species names
+    species_mapping = {
+        'White shark': 'White Shark',
+        'white shark': 'White Shark',
+        'Great white shark': 'White Shark',
+        'Great White Shark': 'White Shark',
+        'Tiger shark': 'Tiger Shark',
+        'tiger shark': 'Tiger Shark',
+        'Bull shark': 'Bull Shark',
+        'bull shark': 'Bull Shark'
+    }
+
+    # Invalid markers map to NaN in the same pass
+    species_mapping.update(dict.fromkeys(invalid_markers, np.nan))
+
+    return _map_categories(species, species_mapping)
+
+
+def _parse_date_frame(dates):
+    """Parse 'Date' strings like '27th November' combined with a numeric 'Year'."""
+    # Pattern: "27th November" or "10th November" etc.
+    parts = dates['Date'].astype('string').str.extract(_DATE_RE)
+    # Fractional years cannot form a date; mask them so they parse to NaT
+    year = dates['Year'].where(dates['Year'] % 1 == 0).astype('Int64').astype('string')
+
+    # Construct date strings and parse them in a single call
+    date_str = parts['day'] + ' ' + parts['month'] + ' ' + year
+    return pd.to_datetime(date_str, format='%d %B %Y', errors='coerce').rename('Date_Parsed')
+
 
 class DataCleaner:
     """
@@ -19,6 +219,7 @@ class DataCleaner:
     - Column standardization (Sex, Fatal, Type, Age, Country, Activity, Species)
     - Date parsing
     - Missing value handling
+    - Dtype optimization (categorical and downcast numeric columns)
 
     Attributes:
         df (pd.DataFrame): The dataframe being cleaned
@@ -26,15 +227,17 @@ class DataCleaner:
         cleaning_log (list): Log of cleaning operations performed
     """
 
-    def __init__(self, df, verbose=False):
+    def __init__(self, df, verbose=False, copy=True):
         """
         Initialize the DataCleaner with a dataframe.
 
         Args:
             df (pd.DataFrame): Input dataframe to clean
             verbose (bool): Whether to log cleaning steps
+            copy (bool): Whether to work on a copy of df. Pass False to avoid
+                doubling memory when the input dataframe is no longer needed
         """
-        self.df = df.copy()
+        self.df = df.copy() if copy else df
         self.verbose = verbose
         self.cleaning_log = []
 
@@ -51,12 +254,15 @@ class DataCleaner:
         Returns:
             self: For method chaining
         """
+        # Fraction of missing values per column, computed in a single pass
+        missing_pct = self.df.isnull().mean()
+
         # Identify columns with all NaN values
-        empty_cols = self.df.columns[self.df.isnull().all()].tolist()
+        empty_cols = missing_pct.index[missing_pct == 1.0].tolist()
 
         # Also remove columns that are named "Unnamed: X" and have >95% missing values
         unnamed_cols = [col for col in self.df.columns
-                       if col.startswith('Unnamed:') and self.df[col].isnull().sum() / len(self.df) > 0.95]
+                        if col.startswith('Unnamed:') and missing_pct[col] > 0.95]
 
         cols_to_drop = list(set(empty_cols + unnamed_cols))
 
@@ -90,25 +296,7 @@ class DataCleaner:
         if 'Sex' not in self.df.columns:
             return self
 
-        # Strip whitespace and convert to uppercase
-        self.df['Sex'] = self.df['Sex'].astype(str).str.strip().str.upper()
-
-        # Map variations to standard values
-        sex_mapping = {
-            'M': 'M',
-            'F': 'F',
-            'MALE': 'M',
-            'FEMALE': 'F',
-            'N': np.nan,
-            'NAN': np.nan,
-            '.': np.nan,
-            '': np.nan
-        }
-
-        self.df['Sex'] = self.df['Sex'].replace(sex_mapping)
-
-        # Set anything not M or F to NaN
-        self.df.loc[~self.df['Sex'].isin(['M', 'F']), 'Sex'] = np.nan
+        self.df['Sex'] = _clean_sex_series(self.df['Sex'])
 
         self.log_step(f"Cleaned Sex column - unique values: {self.df['Sex'].unique()}")
 
@@ -124,27 +312,7 @@ class DataCleaner:
         if 'Fatal Y/N' not in self.df.columns:
             return self
 
-        # Strip whitespace and convert to uppercase
-        self.df['Fatal Y/N'] = self.df['Fatal Y/N'].astype(str).str.strip().str.upper()
-
-        # Map variations to standard values
-        fatal_mapping = {
-            'Y': 'Y',
-            'N': 'N',
-            'YES': 'Y',
-            'NO': 'N',
-            'F': 'Y',  # F might mean Fatal
-            'M': np.nan,
-            'UNKNOWN': np.nan,
-            'NAN': np.nan,
-            '': np.nan,
-            '2017': np.nan  # Sometimes has erroneous data
-        }
-
-        self.df['Fatal Y/N'] = self.df['Fatal Y/N'].replace(fatal_mapping)
-
-        # Set anything not Y or N to NaN
-        self.df.loc[~self.df['Fatal Y/N'].isin(['Y', 'N']), 'Fatal Y/N'] = np.nan
+        self.df['Fatal Y/N'] = _clean_fatal_series(self.df['Fatal Y/N'])
 
         self.log_step(f"Cleaned Fatal Y/N column - unique values: {self.df['Fatal Y/N'].unique()}")
 
@@ -160,11 +328,7 @@ class DataCleaner:
         if 'Type' not in self.df.columns:
             return self
 
-        # Strip whitespace
-        self.df['Type'] = self.df['Type'].astype(str).str.strip()
-
-        # Replace 'Invalid' or 'Questionable' with NaN
-        self.df.loc[self.df['Type'].isin(['Invalid', 'Questionable', 'Unconfirmed', 'Unverified']), 'Type'] = np.nan
+        self.df['Type'] = _clean_type_series(self.df['Type'])
 
         self.log_step(f"Cleaned Type column - unique values: {self.df['Type'].nunique()}")
 
@@ -181,45 +345,7 @@ class DataCleaner:
         if 'Age' not in self.df.columns:
             return self
 
-        def parse_age(age_str):
-            """Parse various age formats to a numeric value."""
-            if pd.isna(age_str):
-                return np.nan
-
-            age_str = str(age_str).strip().lower()
-
-            # Handle empty strings
-            if age_str in ['', 'nan', 'unknown', '?']:
-                return np.nan
-
-            # Extract first number found
-            numbers = re.findall(r'\d+', age_str)
-            if numbers:
-                age = int(numbers[0])
-                # Validate reasonable age range
-                if 0 < age < 120:
-                    return age
-
-            # Handle text descriptions
-            age_text_mapping = {
-                'teen': 15,
-                'teenager': 15,
-                'adult': 30,
-                'child': 8,
-                'boy': 10,
-                'girl': 10,
-                'young': 25,
-                'elderly': 70,
-                'middle': 45
-            }
-
-            for key, value in age_text_mapping.items():
-                if key in age_str:
-                    return value
-
-            return np.nan
-
-        self.df['Age'] = self.df['Age'].apply(parse_age)
+        self.df['Age'] = _clean_age_series(self.df['Age'])
 
         self.log_step(f"Cleaned Age column - valid ages: {self.df['Age'].notna().sum()}")
 
@@ -235,29 +361,7 @@ class DataCleaner:
         if 'Country' not in self.df.columns:
             return self
 
-        # Strip whitespace and standardize case
-        self.df['Country'] = self.df['Country'].astype(str).str.strip().str.upper()
-
-        # Common country name standardizations
-        country_mapping = {
-            'USA': 'USA',
-            'UNITED STATES': 'USA',
-            'UNITED STATES OF AMERICA': 'USA',
-            'US': 'USA',
-            'AUSTRALIA': 'AUSTRALIA',
-            'SOUTH AFRICA': 'SOUTH AFRICA',
-            'RSA': 'SOUTH AFRICA',
-            'REPUBLIC OF SOUTH AFRICA': 'SOUTH AFRICA',
-            'ENGLAND': 'UNITED KINGDOM',
-            'SCOTLAND': 'UNITED KINGDOM',
-            'WALES': 'UNITED KINGDOM',
-            'UK': 'UNITED KINGDOM'
-        }
-
-        self.df['Country'] = self.df['Country'].replace(country_mapping)
-
-        # Replace 'NAN' string with actual NaN
-        self.df.loc[self.df['Country'] == 'NAN', 'Country'] = np.nan
+        self.df['Country'] = _clean_country_series(self.df['Country'])
 
         self.log_step(f"Cleaned Country column - unique countries: {self.df['Country'].nunique()}")
 
@@ -273,11 +377,7 @@ class DataCleaner:
         if 'Activity' not in self.df.columns:
             return self
 
-        # Strip whitespace and standardize case
-        self.df['Activity'] = self.df['Activity'].astype(str).str.strip().str.title()
-
-        # Replace 'Nan' with actual NaN
-        self.df.loc[self.df['Activity'].str.lower() == 'nan', 'Activity'] = np.nan
+        self.df['Activity'] = _clean_activity_series(self.df['Activity'])
 
         self.log_step(f"Cleaned Activity column - unique activities: {self.df['Activity'].nunique()}")
 
@@ -296,34 +396,73 @@ class DataCleaner:
         if species_col not in self.df.columns:
             return self
 
-        # Strip whitespace
-        self.df[species_col] = self.df[species_col].astype(str).str.strip()
+        self.df[species_col] = _clean_species_series(self.df[species_col])
+
+        # Drop the trailing space so downstream code can always use 'Species'
+        if species_col != 'Species':
+            self.df.rename(columns={species_col: 'Species'}, inplace=True)
+
+        self.log_step(f"Cleaned Species column - unique species: {self.df['Species'].nunique()}")
+
+        return self
+
+    def clean_columns(self, backend=None, max_workers=None):
+        """
+        Run all column standardization steps (Sex, Fatal, Type, Age, Country,
+        Activity, Species).
+
+        The steps are independent of each other, so they can be dispatched
+        concurrently. Most of the work happens in pandas C code, so threads
+        are enough to use several cores.
+
+        Args:
+            backend (str, optional): None to run serially, 'threads' for a
+                thread pool or 'dask' for dask.delayed with the threaded scheduler
+            max_workers (int, optional): Number of worker threads
 
-        # Replace invalid/unknown markers with NaN
-        invalid_markers = [
-            'Invalid', 'Unknown', 'Not stated', 'Unconfirmed',
-            'Shark involvement not confirmed',
-            'Shark involvement prior to death was not confirmed',
-            'No shark involvement', 'Questionable', 'nan'
+        Returns:
+            self: For method chaining
+        """
+        if backend is None:
+            return (self
+                    .clean_sex_column()
+                    .clean_fatal_column()
+                    .clean_type_column()
+                    .clean_age_column()
+                    .clean_country_column()
+                    .clean_activity_column()
+                    .clean_species_column())
+
+        species_col = 'Species ' if 'Species ' in self.df.columns else 'Species'
+        tasks = [
+            ('Sex', _clean_sex_series),
+            ('Fatal Y/N', _clean_fatal_series),
+            ('Type', _clean_type_series),
+            ('Age', _clean_age_series),
+            ('Country', _clean_country_series),
+            ('Activity', _clean_activity_series),
+            (species_col, _clean_species_series)
         ]
+        tasks = [(col, func) for col, func in tasks if col in self.df.columns]
 
-        self.df.loc[self.df[species_col].isin(invalid_markers), species_col] = np.nan
-
-        # Standardize common species names
-        species_mapping = {
-            'White shark': 'White Shark',
-            'white shark': 'White Shark',
-            'Great white shark': 'White Shark',
-            'Great White Shark': 'White Shark',
-            'Tiger shark': 'Tiger Shark',
-            'tiger shark': 'Tiger Shark',
-            'Bull shark': 'Bull Shark',
-            'bull shark': 'Bull Shark'
-        }
+        if backend == 'threads':
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(lambda task: task[1](self.df[task[0]]), tasks))
+        elif backend == 'dask':
+            import dask
+
+            delayed = [dask.delayed(func)(self.df[col]) for col, func in tasks]
+            results = dask.compute(*delayed, scheduler='threads', num_workers=max_workers)
+        else:
+            raise ValueError(f"Unknown backend '{backend}', expected None, 'threads' or 'dask'")
+
+        for (col, _), cleaned in zip(tasks, results):
+            self.df[col] = cleaned
 
-        self.df[species_col] = self.df[species_col].replace(species_mapping)
+        if species_col != 'Species' and species_col in self.df.columns:
+            self.df.rename(columns={species_col: 'Species'}, inplace=True)
 
-        self.log_step(f"Cleaned Species column - unique species: {self.df[species_col].nunique()}")
+        self.log_step(f"Cleaned {len(tasks)} columns using '{backend}' backend")
 
         return self
 
@@ -338,37 +477,11 @@ class DataCleaner:
         if 'Date' not in self.df.columns:
             return self
 
-        def extract_date(date_str, year_str):
-            """Extract date from various formats."""
-            if pd.isna(date_str):
-                return np.nan
-
-            date_str = str(date_str).strip()
-
-            # Pattern: "27th November" or "10th November" etc.
-            pattern = r'(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)'
-            match = re.search(pattern, date_str)
-
-            if match and year_str and str(year_str).isdigit():
-                day = match.group(1)
-                month = match.group(2)
-                year = str(year_str).strip()
-
-                try:
-                    # Construct date string and parse
-                    date_obj = pd.to_datetime(f"{day} {month} {year}", format='%d %B %Y', errors='coerce')
-                    return date_obj
-                except:
-                    return np.nan
-
-            return np.nan
-
-        # Apply date parsing
-        self.df['Date_Parsed'] = self.df.apply(lambda row: extract_date(row['Date'], row['Year']), axis=1)
-
-        # Also ensure Year is numeric
+        # Ensure Year is numeric
         self.df['Year'] = pd.to_numeric(self.df['Year'], errors='coerce')
 
+        self.df['Date_Parsed'] = _parse_date_frame(self.df[['Date', 'Year']])
+
         parsed_count = self.df['Date_Parsed'].notna().sum()
         self.log_step(f"Parsed {parsed_count} dates successfully")
 
@@ -398,12 +511,40 @@ class DataCleaner:
 
         return self
 
-    def clean_all(self, threshold=0.7):
+    def optimize_dtypes(self):
+        """
+        Convert repeated-text columns to the category dtype and downcast
+        numeric columns to reduce memory and speed up value counts and grouping.
+
+        Returns:
+            self: For method chaining
+        """
+        categorical_cols = ['Sex', 'Fatal Y/N', 'Type', 'Country', 'Activity', 'Species']
+
+        for col in categorical_cols:
+            # Columns remapped during cleaning are already categorical; re-casting
+            # them would only produce a read-only view that rejects later edits
+            if col in self.df.columns and not isinstance(self.df[col].dtype, pd.CategoricalDtype):
+                self.df[col] = self.df[col].astype('category')
+
+        if 'Year' in self.df.columns:
+            self.df['Year'] = pd.to_numeric(self.df['Year'], errors='coerce', downcast='float')
+
+        if 'Age' in self.df.columns and pd.api.types.is_numeric_dtype(self.df['Age']):
+            self.df['Age'] = self.df['Age'].astype('float32')
+
+        self.log_step(f"Optimized dtypes - memory usage: {self.df.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+
+        return self
+
+    def clean_all(self, threshold=0.7, backend=None, max_workers=None):
         """
         Run the complete cleaning pipeline.
 
         Args:
             threshold (float): Missing value threshold for column removal
+            backend (str, optional): Column cleaning backend (None, 'threads' or 'dask')
+            max_workers (int, optional): Number of workers for parallel column cleaning
 
         Returns:
             pd.DataFrame: Cleaned dataframe
@@ -413,15 +554,10 @@ class DataCleaner:
         (self
          .remove_empty_columns()
          .remove_duplicates()
-         .clean_sex_column()
-         .clean_fatal_column()
-         .clean_type_column()
-         .clean_age_column()
-         .clean_country_column()
-         .clean_activity_column()
-         .clean_species_column()
+         .clean_columns(backend, max_workers)
          .parse_dates()
-         .handle_missing_values(threshold))
+         .handle_missing_values(threshold)
+         .optimize_dtypes())
 
         self.log_step(f"Cleaning complete - Final shape: {self.df.shape}")
 
@@ -449,83 +585,118 @@ def clean_data(filepath, save_cleaned=True, verbose=False):
 
     Args:
         filepath (str): Path to the raw CSV file
-        save_cleaned (bool): Whether to save the cleaned data to a new file
+        save_cleaned (bool): Whether to save the cleaned data next to the raw
+            file, as Parquet (shark_attacks_cleaned.parquet) and as CSV
+            (shark_attacks_cleaned.csv, read by the notebooks)
         verbose (bool): Whether to show cleaning progress
 
     Returns:
         pd.DataFrame: Cleaned dataframe
     """
-    # Load data
-    df = pd.read_csv(filepath, sep=";", low_memory=False)
+    # Load data with the multithreaded pyarrow parser
+    df = pd.read_csv(filepath, sep=";", engine="pyarrow")
+
+    # pyarrow keeps duplicate and empty header names as-is, so reuse the
+    # de-duplicated names ('Case Number.1', 'Unnamed: 21', ...) from the C parser
+    df.columns = pd.read_csv(filepath, sep=";", nrows=0).columns
 
     # Clean using DataCleaner class
-    cleaner = DataCleaner(df, verbose=verbose)
+    cleaner = DataCleaner(df, verbose=verbose, copy=False)
     df_clean = cleaner.clean_all()
 
-    # Save if requested
+    # Save if requested (Parquet keeps the optimized dtypes, unlike CSV; the
+    # CSV is still written because the notebooks load it)
     if save_cleaned:
-        output_path = filepath.replace('.csv', '_cleaned.csv')
-        df_clean.to_csv(output_path, index=False)
+        df_clean.to_parquet(filepath.replace('.csv', '_cleaned.parquet'), compression='zstd')
+        df_clean.to_csv(filepath.replace('.csv', '_cleaned.csv'), index=False)
 
     return df_clean
 
 
+def load_cleaned(filepath):
+    """
+    Load a cleaned dataset previously saved by clean_data.
+
+    Categorical and downcast numeric dtypes survive the round-trip, so the
+    cleaning pipeline does not need to be run again.
+
+    Args:
+        filepath (str): Path to the cleaned Parquet file
+
+    Returns:
+        pd.DataFrame: Cleaned dataframe
+    """
+    return pd.read_parquet(filepath)
+
+
 # Legacy standalone functions for backward compatibility
+def _legacy_cleaner(df):
+    """Create a cleaner on a shallow copy so the caller's dataframe is not modified."""
+    return DataCleaner(df.copy(deep=False), copy=False)
+
+def _clean_column(df, column, clean_func):
+    """Return a shallow copy of df with a single column cleaned."""
+    df = df.copy(deep=False)
+    if column in df.columns:
+        df[column] = clean_func(df[column])
+    return df
+
 def remove_empty_columns(df):
     """Remove empty columns from dataframe."""
-    cleaner = DataCleaner(df)
+    cleaner = _legacy_cleaner(df)
     return cleaner.remove_empty_columns().df
 
 def remove_duplicates(df):
     """Remove duplicate rows from dataframe."""
-    cleaner = DataCleaner(df)
+    cleaner = _legacy_cleaner(df)
     return cleaner.remove_duplicates().df
 
 def clean_sex_column(df):
     """Clean Sex column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_sex_column().df
+    return _clean_column(df, 'Sex', _clean_sex_series)
 
 def clean_fatal_column(df):
     """Clean Fatal Y/N column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_fatal_column().df
+    return _clean_column(df, 'Fatal Y/N', _clean_fatal_series)
 
 def clean_type_column(df):
     """Clean Type column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_type_column().df
+    return _clean_column(df, 'Type', _clean_type_series)
 
 def clean_age_column(df):
     """Clean Age column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_age_column().df
+    return _clean_column(df, 'Age', _clean_age_series)
 
 def clean_country_column(df):
     """Clean Country column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_country_column().df
+    return _clean_column(df, 'Country', _clean_country_series)
 
 def clean_activity_column(df):
     """Clean Activity column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_activity_column().df
+    return _clean_column(df, 'Activity', _clean_activity_series)
 
 def clean_species_column(df):
     """Clean Species column."""
-    cleaner = DataCleaner(df)
-    return cleaner.clean_species_column().df
+    species_col = 'Species ' if 'Species ' in df.columns else 'Species'
+    df = _clean_column(df, species_col, _clean_species_series)
+    df.rename(columns={'Species ': 'Species'}, inplace=True)
+    return df
 
 def parse_dates(df):
     """Parse dates."""
+    # Full copy: inserting Date_Parsed into an unconsolidated frame fragments it
     cleaner = DataCleaner(df)
     return cleaner.parse_dates().df
 
 def handle_missing_values(df, threshold=0.5):
     """Handle missing values."""
-    cleaner = DataCleaner(df)
+    cleaner = _legacy_cleaner(df)
     return cleaner.handle_missing_values(threshold).df
 
+def optimize_dtypes(df):
+    """Optimize column dtypes."""
+    cleaner = _legacy_cleaner(df)
+    return cleaner.optimize_dtypes().df
 
 if __name__ == "__main__":
     # Example usage
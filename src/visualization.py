@@ -3,12 +3,195 @@ Visualization functions for Shark Attacks dataset.
 This module provides reusable plotting functions for data visualization.
 """
 
+import hashlib
+import inspect
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+
+import matplotlib
+
+# Figures are only written to disk, so use the non-interactive Agg backend
+# unless a backend was already chosen (e.g. Jupyter's inline backend sets
+# MPLBACKEND, and an earlier pyplot import has already picked one)
+if 'MPLBACKEND' not in os.environ and 'matplotlib.pyplot' not in sys.modules:
+    matplotlib.use('Agg')
+
 import matplotlib.pyplot as plt
-import seaborn as sns
+import numpy as np
+from cycler import cycler
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image
+
+# Title and axis label fonts shared by every plot
+_TEXT_RC = {'axes.titlesize': 16, 'axes.titleweight': 'bold', 'axes.labelsize': 12}
+
+# seaborn's named palettes (default sizes), precomputed so seaborn is not needed
+_SEABORN_PALETTES = {
+    'husl': ['#f77189', '#bb9832', '#50b131', '#36ada4', '#3ba3ec', '#e866f4'],
+    'deep': ['#4c72b0', '#dd8452', '#55a868', '#c44e52', '#8172b3',
+             '#937860', '#da8bc3', '#8c8c8c', '#ccb974', '#64b5cd'],
+    'muted': ['#4878d0', '#ee854a', '#6acc64', '#d65f5f', '#956cb4',
+              '#8c613c', '#dc7ec0', '#797979', '#d5bb67', '#82c6e2'],
+    'pastel': ['#a1c9f4', '#ffb482', '#8de5a1', '#ff9f9b', '#d0bbff',
+               '#debb9b', '#fab0e4', '#cfcfcf', '#fffea3', '#b9f2f0'],
+    'bright': ['#023eff', '#ff7c00', '#1ac938', '#e8000b', '#8b2be2',
+               '#9f4800', '#f14cc1', '#a3a3a3', '#ffc400', '#00d7ff'],
+    'dark': ['#001c7f', '#b1400d', '#12711c', '#8c0800', '#591e71',
+             '#592f0d', '#a23582', '#3c3c3c', '#b8850a', '#006374'],
+    'colorblind': ['#0173b2', '#de8f05', '#029e73', '#d55e00', '#cc78bc',
+                   '#ca9161', '#fbafe4', '#949494', '#ece133', '#56b4e9'],
+}
+
+# Fixed colors and thresholds shared across plots
+_GENDER_COLORS = {'M': '#3498db', 'F': '#e74c3c'}
+_GENDER_LABELS = {'M': 'Male', 'F': 'Female'}
+_FATAL_COLORS = ('#2ecc71', '#e74c3c')
+_RISK_THRESHOLDS = np.array([30, 50])
+
+# Figures kept for reuse, keyed by figsize; only used in render_all workers
+_FIGURE_POOL = {}
+_USE_FIGURE_POOL = False
+
+
+def _with_text_style(plot_func):
+    """
+    Build a plot with the report's title and label fonts.
+
+    The fonts are applied through a temporary rc_context, so they neither
+    leak into other plots in the session nor get lost to a later
+    plt.style.use or rcdefaults.
+
+    Args:
+        plot_func (callable): plot_* function to wrap
+
+    Returns:
+        callable: The wrapped function
+    """
+    @wraps(plot_func)
+    def wrapper(*args, **kwargs):
+        with plt.rc_context(_TEXT_RC):
+            return plot_func(*args, **kwargs)
+    return wrapper
+
+
+def _fast_save(fig, save_path, dpi):
+    """
+    Write a PNG straight from the Agg pixel buffer.
+
+    Draws the figure once at the requested dpi and hands the RGBA buffer to
+    Pillow, skipping savefig's print_figure machinery.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to save; must use an Agg-based canvas
+        save_path (str or file): Destination PNG path or open binary file
+        dpi (int): Resolution of the saved figure
+    """
+    original_dpi = fig.dpi
+    fig.dpi = dpi
+    try:
+        fig.canvas.draw()
+        image = Image.fromarray(np.asarray(fig.canvas.buffer_rgba()))
+    finally:
+        fig.dpi = original_dpi
+    image.save(save_path, format='png', optimize=True, dpi=(dpi, dpi))
+
+
+def _ensure_report_dir(directory):
+    """
+    Create an output directory if it does not exist yet.
+
+    Args:
+        directory (str): Directory to create; '' means the working directory
+    """
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+def _save_figure(fig, save_path, dpi):
+    """
+    Save a figure, passing size-optimizing Pillow options for raster formats.
+
+    WebP output is written lossless and PNG output is written from the Agg
+    buffer with Pillow's optimizer; any other format is saved with
+    matplotlib's defaults. The parent directory is created if needed, and
+    PNG/WebP files are opened once and written through the handle.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to save
+        save_path (str): Destination path; its suffix selects the format
+        dpi (int): Resolution of the saved figure
+    """
+    save_path = os.fspath(save_path)
+    _ensure_report_dir(os.path.dirname(save_path))
+
+    suffix = os.path.splitext(save_path)[1].lower()
+    if suffix not in ('.png', '.webp'):
+        # Other formats go by path, so matplotlib validates the format (and
+        # appends its default extension) before any file is created
+        fig.savefig(save_path, dpi=dpi)
+        return
+
+    with open(save_path, 'wb') as f:
+        if suffix == '.webp':
+            fig.savefig(f, format='webp', dpi=dpi, pil_kwargs={'lossless': True})
+        elif isinstance(fig.canvas, FigureCanvasAgg):
+            _fast_save(fig, f, dpi)
+        else:
+            fig.savefig(f, format='png', dpi=dpi, pil_kwargs={'optimize': True})
+
+
+def _subplots(figsize, nrows=1, ncols=1):
+    """
+    Create a figure with a grid of axes, reusing a pooled figure when enabled.
+
+    Pooled figures are cleared and made current again instead of allocating
+    a new figure and Agg canvas for every plot of the same size.
+
+    Args:
+        figsize (tuple): Figure size
+        nrows (int): Number of subplot rows
+        ncols (int): Number of subplot columns
+
+    Returns:
+        tuple: (figure, axes) as returned by plt.subplots
+    """
+    if not _USE_FIGURE_POOL:
+        return plt.subplots(nrows, ncols, figsize=figsize)
+
+    key = tuple(figsize)
+    fig = _FIGURE_POOL.get(key)
+    if fig is not None and plt.fignum_exists(fig.number):
+        fig.clear()
+        plt.figure(fig.number)
+    else:
+        fig = _FIGURE_POOL[key] = plt.figure(figsize=figsize)
+    return fig, fig.subplots(nrows, ncols)
+
+
+def _close_figure(fig, close):
+    """
+    Release a figure from pyplot so repeated calls do not accumulate open figures.
+
+    Pooled figures are kept open so they can be reused.
+
+    Args:
+        fig (matplotlib.figure.Figure): Figure to close
+        close (bool, optional): Close the figure; None closes it only when
+            pyplot is not interactive, so plt.show() still displays it in Jupyter
+    """
+    if _USE_FIGURE_POOL:
+        return
+    if close is None:
+        close = not plt.isinteractive()
+    if close:
+        plt.close(fig)
 
 
-def plot_top_countries(top_countries, top3_pct=None, figsize=(12, 6), save_path='reports/h1_geographic.png'):
+@_with_text_style
+def plot_top_countries(top_countries, top3_pct=None, figsize=(12, 6), save_path='reports/h1_geographic.png', dpi=150, close=None):
     """
     Plot top countries by shark attacks.
 
@@ -17,17 +200,21 @@ def plot_top_countries(top_countries, top3_pct=None, figsize=(12, 6), save_path=
         top3_pct (float, optional): Percentage for top 3 countries annotation
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/h1_geographic.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
-    top_countries.plot(kind='bar', color='steelblue', ax=ax)
-    ax.set_title('Top 10 Countries by Shark Attacks', fontsize=16, fontweight='bold')
-    ax.set_xlabel('Country', fontsize=12)
-    ax.set_ylabel('Number of Attacks', fontsize=12)
+    fig, ax = _subplots(figsize)
+    ax.bar(top_countries.index.astype(str), top_countries.values, width=0.5, color='steelblue')
+    ax.set_title('Top 10 Countries by Shark Attacks')
+    ax.set_xlabel('Country')
+    ax.set_ylabel('Number of Attacks')
     ax.grid(axis='y', alpha=0.3)
-    plt.xticks(rotation=45, ha='right')
+    ax.tick_params(axis='x', rotation=45)
+    for label in ax.get_xticklabels():
+        label.set_ha('right')
 
     if top3_pct:
         ax.text(0.98, 0.98, f'Top 3 = {top3_pct:.1f}%',
@@ -39,12 +226,14 @@ def plot_top_countries(top_countries, top3_pct=None, figsize=(12, 6), save_path=
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_top_activities(top_activities, activity_pct=None, figsize=(12, 6), save_path='reports/h2_activities.png'):
+@_with_text_style
+def plot_top_activities(top_activities, activity_pct=None, figsize=(12, 6), save_path='reports/h2_activities.png', dpi=150, close=None):
     """
     Plot top activities during shark attacks.
 
@@ -53,15 +242,19 @@ def plot_top_activities(top_activities, activity_pct=None, figsize=(12, 6), save
         activity_pct (float, optional): Percentage for surfing/swimming annotation
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/h2_activities.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
-    top_activities.plot(kind='barh', color='coral', ax=ax)
-    ax.set_title('Top 10 Activities During Shark Attacks', fontsize=16, fontweight='bold')
-    ax.set_xlabel('Number of Attacks', fontsize=12)
-    ax.set_ylabel('Activity', fontsize=12)
+    fig, ax = _subplots(figsize)
+    bars = ax.barh(top_activities.index.astype(str), top_activities.values, height=0.5, color='coral')
+    for bar in bars:
+        bar.set_rasterized(True)
+    ax.set_title('Top 10 Activities During Shark Attacks')
+    ax.set_xlabel('Number of Attacks')
+    ax.set_ylabel('Activity')
     ax.grid(axis='x', alpha=0.3)
 
     if activity_pct:
@@ -74,12 +267,14 @@ def plot_top_activities(top_activities, activity_pct=None, figsize=(12, 6), save
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_gender_analysis(gender_counts, fatal_by_gender, ratio=None, figsize=(14, 6), save_path='reports/h3_gender.png'):
+@_with_text_style
+def plot_gender_analysis(gender_counts, fatal_by_gender, ratio=None, figsize=(14, 6), save_path='reports/h3_gender.png', dpi=150, close=None):
     """
     Plot gender distribution and fatality rates.
 
@@ -89,16 +284,19 @@ def plot_gender_analysis(gender_counts, fatal_by_gender, ratio=None, figsize=(14
         ratio (float, optional): Male to female ratio
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/h3_gender.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+    fig, (ax1, ax2) = _subplots(figsize, 1, 2)
 
     # Pie chart
-    colors = ['#3498db', '#e74c3c']
-    gender_counts.plot(kind='pie', autopct='%1.1f%%', startangle=90, colors=colors, ax=ax1)
-    ax1.set_title('Shark Attacks by Gender', fontsize=16, fontweight='bold')
+    # Colors follow the label, since the pie and bar series are ordered differently
+    ax1.pie(gender_counts.values, labels=gender_counts.index, autopct='%1.1f%%', startangle=90,
+            colors=[_GENDER_COLORS.get(sex, 'gray') for sex in gender_counts.index])
+    ax1.set_title('Shark Attacks by Gender')
     ax1.set_ylabel('')
 
     if ratio:
@@ -108,22 +306,25 @@ def plot_gender_analysis(gender_counts, fatal_by_gender, ratio=None, figsize=(14
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     # Fatality rate bar chart
-    fatal_by_gender.plot(kind='bar', color=['#3498db', '#e74c3c'], ax=ax2)
-    ax2.set_title('Fatality Rate by Gender', fontsize=16, fontweight='bold')
-    ax2.set_xlabel('Gender', fontsize=12)
-    ax2.set_ylabel('Fatality Rate (%)', fontsize=12)
-    ax2.set_xticklabels(['Male', 'Female'], rotation=0)
+    gender_labels = [_GENDER_LABELS.get(sex, sex) for sex in fatal_by_gender.index]
+    ax2.bar(gender_labels, fatal_by_gender.values, width=0.5,
+            color=[_GENDER_COLORS.get(sex, 'gray') for sex in fatal_by_gender.index])
+    ax2.set_title('Fatality Rate by Gender')
+    ax2.set_xlabel('Gender')
+    ax2.set_ylabel('Fatality Rate (%)')
     ax2.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_temporal_trends(attacks_by_decade, attacks_by_year, increase_pct=None, figsize=(14, 10), save_path='reports/h4_temporal.png'):
+@_with_text_style
+def plot_temporal_trends(attacks_by_decade, attacks_by_year, increase_pct=None, figsize=(14, 10), save_path='reports/h4_temporal.png', dpi=150, close=None, backend='matplotlib'):
     """
     Plot temporal trends - decades and yearly.
 
@@ -133,17 +334,25 @@ def plot_temporal_trends(attacks_by_decade, attacks_by_year, increase_pct=None,
         increase_pct (float, optional): Percentage increase over time
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/h4_temporal.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
+        backend (str): 'matplotlib' to draw the yearly trend as vector lines, or
+            'datashader' to rasterize it as a single image (requires datashader)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, (ax1, ax2) = plt.subplots(2, 1, figsize=figsize)
+    if backend not in ('matplotlib', 'datashader'):
+        raise ValueError(f"Unknown backend '{backend}', expected 'matplotlib' or 'datashader'")
+
+    fig, (ax1, ax2) = _subplots(figsize, 2, 1)
 
     # Decade trend
-    attacks_by_decade.plot(kind='bar', color='teal', ax=ax1)
-    ax1.set_title('Shark Attacks by Decade', fontsize=16, fontweight='bold')
-    ax1.set_xlabel('Decade', fontsize=12)
-    ax1.set_ylabel('Number of Attacks', fontsize=12)
+    ax1.bar(attacks_by_decade.index.astype(str), attacks_by_decade.values, width=0.5, color='teal')
+    ax1.tick_params(axis='x', labelrotation=90)
+    ax1.set_title('Shark Attacks by Decade')
+    ax1.set_xlabel('Decade')
+    ax1.set_ylabel('Number of Attacks')
     ax1.grid(axis='y', alpha=0.3)
 
     if increase_pct:
@@ -154,22 +363,60 @@ def plot_temporal_trends(attacks_by_decade, attacks_by_year, increase_pct=None,
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     # Recent years trend
-    attacks_by_year.plot(kind='line', marker='o', color='darkred', linewidth=2, ax=ax2)
-    ax2.set_title('Shark Attacks Trend (Recent 50 Years)', fontsize=16, fontweight='bold')
-    ax2.set_xlabel('Year', fontsize=12)
-    ax2.set_ylabel('Number of Attacks', fontsize=12)
+    if backend == 'datashader':
+        _shade_trend(ax2, attacks_by_year)
+    else:
+        ax2.plot(attacks_by_year.index.values, attacks_by_year.values, marker='o', color='darkred', linewidth=2)
+        # Rasterize the data layer only; titles and axes stay vector in PDF/SVG output
+        area = ax2.fill_between(attacks_by_year.index, attacks_by_year.values, alpha=0.3, color='darkred')
+        area.set_rasterized(True)
+    ax2.set_title('Shark Attacks Trend (Recent 50 Years)')
+    ax2.set_xlabel('Year')
+    ax2.set_ylabel('Number of Attacks')
     ax2.grid(True, alpha=0.3)
-    ax2.fill_between(attacks_by_year.index, attacks_by_year.values, alpha=0.3, color='darkred')
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_species(top_species, figsize=(12, 6), save_path='reports/species.png'):
+def _shade_trend(ax, attacks_by_year, width=1200, height=400):
+    """
+    Draw a yearly trend as a datashader raster instead of vector artists.
+
+    The filled area and the line are aggregated onto a fixed pixel grid, so
+    drawing cost depends on the image size rather than the number of points.
+
+    Args:
+        ax (matplotlib.axes.Axes): Axes to draw on
+        attacks_by_year (pd.Series): Attacks by year
+        width (int): Raster width in pixels
+        height (int): Raster height in pixels
+    """
+    import datashader as ds
+    import datashader.transfer_functions as tf
+
+    trend = pd.DataFrame({'Year': attacks_by_year.index.to_numpy(dtype=float),
+                          'Attacks': attacks_by_year.to_numpy(dtype=float)})
+    x_range = (trend['Year'].min(), trend['Year'].max())
+    y_range = (0, trend['Attacks'].max())
+
+    canvas = ds.Canvas(plot_width=width, plot_height=height, x_range=x_range, y_range=y_range)
+    area = tf.shade(canvas.area(trend, 'Year', 'Attacks'), cmap=['darkred'], alpha=77)
+    line = tf.shade(tf.spread(canvas.line(trend, 'Year', 'Attacks'), px=1), cmap=['darkred'])
+    image = tf.stack(area, line).to_pil()
+
+    ax.imshow(image, extent=(*x_range, *y_range), aspect='auto', interpolation='nearest')
+    ax.set_xlim(x_range)
+    ax.set_ylim(y_range[0], y_range[1] * 1.05)
+
+
+@_with_text_style
+def plot_species(top_species, figsize=(12, 6), save_path='reports/species.png', dpi=150, close=None):
     """
     Plot top shark species involved in attacks.
 
@@ -177,25 +424,31 @@ def plot_species(top_species, figsize=(12, 6), save_path='reports/species.png'):
         top_species (pd.Series): Top species counts
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/species.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
-    top_species.plot(kind='barh', color='darkslategray', ax=ax)
-    ax.set_title('Top 10 Shark Species Involved in Attacks', fontsize=16, fontweight='bold')
-    ax.set_xlabel('Number of Attacks', fontsize=12)
-    ax.set_ylabel('Species', fontsize=12)
+    fig, ax = _subplots(figsize)
+    bars = ax.barh(top_species.index.astype(str), top_species.values, height=0.5, color='darkslategray')
+    for bar in bars:
+        bar.set_rasterized(True)
+    ax.set_title('Top 10 Shark Species Involved in Attacks')
+    ax.set_xlabel('Number of Attacks')
+    ax.set_ylabel('Species')
     ax.grid(axis='x', alpha=0.3)
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_age_distribution(age_data, figsize=(14, 6), save_path='reports/age_distribution.png'):
+@_with_text_style
+def plot_age_distribution(age_data, figsize=(14, 6), save_path='reports/age_distribution.png', dpi=150, close=None):
     """
     Plot age distribution with histogram and box plot.
 
@@ -203,41 +456,51 @@ def plot_age_distribution(age_data, figsize=(14, 6), save_path='reports/age_dist
         age_data (pd.Series): Age data
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/age_distribution.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+    fig, (ax1, ax2) = _subplots(figsize, 1, 2)
+
+    ages = np.asarray(age_data, dtype=np.float64)
+    ages = ages[~np.isnan(ages)]
+    mean, median = ages.mean(), np.median(ages)
 
     # Histogram
-    ax1.hist(age_data, bins=30, color='skyblue', edgecolor='black', alpha=0.7)
-    ax1.set_title('Age Distribution of Shark Attack Victims', fontsize=16, fontweight='bold')
-    ax1.set_xlabel('Age', fontsize=12)
-    ax1.set_ylabel('Frequency', fontsize=12)
-    ax1.axvline(age_data.mean(), color='red', linestyle='--', linewidth=2,
-                label=f'Mean: {age_data.mean():.1f}')
-    ax1.axvline(age_data.median(), color='green', linestyle='--', linewidth=2,
-                label=f'Median: {age_data.median():.1f}')
+    _, _, patches = ax1.hist(ages, bins=30, color='skyblue', edgecolor='black', alpha=0.7)
+    for patch in patches:
+        patch.set_rasterized(True)
+    ax1.set_title('Age Distribution of Shark Attack Victims')
+    ax1.set_xlabel('Age')
+    ax1.set_ylabel('Frequency')
+    ax1.axvline(mean, color='red', linestyle='--', linewidth=2,
+                label=f'Mean: {mean:.1f}')
+    ax1.axvline(median, color='green', linestyle='--', linewidth=2,
+                label=f'Median: {median:.1f}')
     ax1.legend()
     ax1.grid(axis='y', alpha=0.3)
 
     # Box plot
-    ax2.boxplot(age_data, vert=True, patch_artist=True,
+    ax2.boxplot(ages, patch_artist=True,
                 boxprops=dict(facecolor='lightcoral', alpha=0.7),
                 medianprops=dict(color='darkred', linewidth=2))
-    ax2.set_title('Age Distribution Box Plot', fontsize=16, fontweight='bold')
-    ax2.set_ylabel('Age', fontsize=12)
+    ax2.set_title('Age Distribution Box Plot')
+    ax2.set_ylabel('Age')
     ax2.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_fatality_analysis(fatal_counts, fatality_by_country, overall_rate=None, figsize=(14, 6), save_path='reports/fatality.png'):
+@_with_text_style
+def plot_fatality_analysis(fatal_counts, fatality_by_country, overall_rate=None, figsize=(14, 6), save_path='reports/fatality.png', dpi=150, close=None):
     """
     Plot fatality rates overall and by country.
 
@@ -247,17 +510,18 @@ def plot_fatality_analysis(fatal_counts, fatality_by_country, overall_rate=None,
         overall_rate (float, optional): Overall fatality rate percentage
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/fatality.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=figsize)
+    fig, (ax1, ax2) = _subplots(figsize, 1, 2)
 
     # Overall fatality pie chart
-    fatal_counts.plot(kind='pie', autopct='%1.1f%%', startangle=90,
-                      colors=['#2ecc71', '#e74c3c'], ax=ax1,
-                      labels=['Non-Fatal', 'Fatal'])
-    ax1.set_title('Overall Attack Outcomes', fontsize=16, fontweight='bold')
+    ax1.pie(fatal_counts.values, autopct='%1.1f%%', startangle=90,
+            colors=_FATAL_COLORS, labels=['Non-Fatal', 'Fatal'])
+    ax1.set_title('Overall Attack Outcomes')
     ax1.set_ylabel('')
 
     if overall_rate:
@@ -267,22 +531,26 @@ def plot_fatality_analysis(fatal_counts, fatality_by_country, overall_rate=None,
                  bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
 
     # Fatality by country
-    fatality_by_country.plot(kind='bar', color='crimson', ax=ax2)
-    ax2.set_title('Fatality Rate by Country (Top 5)', fontsize=16, fontweight='bold')
-    ax2.set_xlabel('Country', fontsize=12)
-    ax2.set_ylabel('Fatality Rate (%)', fontsize=12)
-    ax2.set_xticklabels(ax2.get_xticklabels(), rotation=45, ha='right')
+    ax2.bar(fatality_by_country.index.astype(str), fatality_by_country.values, width=0.5, color='crimson')
+    ax2.set_title('Fatality Rate by Country (Top 5)')
+    ax2.set_xlabel('Country')
+    ax2.set_ylabel('Fatality Rate (%)')
+    ax2.tick_params(axis='x', rotation=45)
+    for label in ax2.get_xticklabels():
+        label.set_ha('right')
     ax2.grid(axis='y', alpha=0.3)
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
 
-def plot_risk_score(surf_by_country, n_safest=7, n_riskiest=8, figsize=(14, 8), save_path='reports/risk_score.png'):
+@_with_text_style
+def plot_risk_score(surf_by_country, n_safest=7, n_riskiest=8, figsize=(14, 8), save_path='reports/risk_score.png', dpi=150, close=None):
     """
     Plot surf location risk scores.
 
@@ -292,30 +560,39 @@ def plot_risk_score(surf_by_country, n_safest=7, n_riskiest=8, figsize=(14, 8),
         n_riskiest (int): Number of riskiest countries to show
         figsize (tuple): Figure size
         save_path (str, optional): Path to save the figure (default: reports/risk_score.png)
+        dpi (int): Resolution of the saved figure
+        close (bool, optional): Close the figure after saving (default: close unless pyplot is interactive, e.g. in Jupyter)
 
     Returns:
         matplotlib.figure.Figure: The created figure
     """
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _subplots(figsize)
 
     # Show safest and riskiest
-    top_bottom = pd.concat([surf_by_country.head(n_safest), surf_by_country.tail(n_riskiest)])
-    colors = ['green' if x < 30 else 'orange' if x < 50 else 'red' for x in top_bottom['Risk_Score']]
-
-    top_bottom['Risk_Score'].plot(kind='barh', color=colors, ax=ax)
-    ax.set_title('Surf Location Risk Score by Country\n(Lower = Safer)',
-                 fontsize=16, fontweight='bold')
-    ax.set_xlabel('Risk Score', fontsize=12)
-    ax.set_ylabel('Country', fontsize=12)
-    ax.axvline(30, color='green', linestyle='--', alpha=0.5, label='Low Risk (<30)')
-    ax.axvline(50, color='orange', linestyle='--', alpha=0.5, label='Medium Risk (30-50)')
+    n_rows = len(surf_by_country)
+    n_tail = min(n_riskiest, n_rows)
+    top_bottom = surf_by_country.iloc[np.r_[:min(n_safest, n_rows), n_rows - n_tail:n_rows]]
+    scores = top_bottom['Risk_Score'].to_numpy()
+    low, medium = _RISK_THRESHOLDS
+    colors = np.select([scores < low, scores < medium], ['green', 'orange'], default='red').tolist()
+
+    # Positional bars so a country in both head and tail is drawn twice
+    positions = range(len(top_bottom))
+    ax.barh(positions, top_bottom['Risk_Score'].values, height=0.5, color=colors)
+    ax.set_yticks(positions, top_bottom.index.astype(str))
+    ax.set_title('Surf Location Risk Score by Country\n(Lower = Safer)')
+    ax.set_xlabel('Risk Score')
+    ax.set_ylabel('Country')
+    ax.axvline(low, color='green', linestyle='--', alpha=0.5, label=f'Low Risk (<{low})')
+    ax.axvline(medium, color='orange', linestyle='--', alpha=0.5, label=f'Medium Risk ({low}-{medium})')
     ax.legend()
     ax.grid(axis='x', alpha=0.3)
 
     plt.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        _save_figure(fig, save_path, dpi)
+    _close_figure(fig, close)
 
     return fig
 
@@ -326,7 +603,160 @@ def set_plot_style(style='seaborn-v0_8-darkgrid', palette='husl'):
 
     Args:
         style (str): Matplotlib style
-        palette (str): Seaborn color palette
+        palette (str or list): A seaborn palette name ('husl', 'deep', 'muted',
+            'pastel', 'bright', 'dark', 'colorblind'), the name of a matplotlib
+            colormap, or a list of colors for the axes color cycle
+
+    Raises:
+        ValueError: If palette is a name that is neither a supported seaborn
+            palette nor a matplotlib colormap
     """
+    if palette in _SEABORN_PALETTES:
+        colors = _SEABORN_PALETTES[palette]
+    elif isinstance(palette, str):
+        if palette not in matplotlib.colormaps:
+            raise ValueError(
+                f"Unknown palette '{palette}', expected one of {sorted(_SEABORN_PALETTES)}, "
+                "a matplotlib colormap name, or a list of colors"
+            )
+        cmap = matplotlib.colormaps[palette]
+        # Qualitative maps (tab10, Set2, ...) are short color lists; sample the others
+        if hasattr(cmap, 'colors') and cmap.N <= 20:
+            colors = list(cmap.colors)
+        else:
+            colors = list(cmap(np.linspace(0, 1, 6)))
+    else:
+        colors = list(palette)
+
     plt.style.use(style)
-    sns.set_palette(palette)
+    plt.rcParams['axes.prop_cycle'] = cycler(color=colors)
+
+
+_PLOTTERS = {
+    'plot_top_countries': plot_top_countries,
+    'plot_top_activities': plot_top_activities,
+    'plot_gender_analysis': plot_gender_analysis,
+    'plot_temporal_trends': plot_temporal_trends,
+    'plot_species': plot_species,
+    'plot_age_distribution': plot_age_distribution,
+    'plot_fatality_analysis': plot_fatality_analysis,
+    'plot_risk_score': plot_risk_score,
+}
+
+
+def _resolve_save_path(name, kwargs):
+    """Return the save_path a plot call will use, falling back to the function default."""
+    if 'save_path' in kwargs:
+        return kwargs['save_path']
+    return inspect.signature(_PLOTTERS[name]).parameters['save_path'].default
+
+
+def _fig_sig(name, kwargs, style):
+    """
+    Fingerprint a plot call from its function name, arguments and style.
+
+    Arguments are bound to the function signature with defaults applied, so a
+    changed default also changes the signature. pandas inputs are hashed by
+    content (values, index and labels), other arguments by their repr, and
+    the source of this module is included so edits to the plotting code
+    invalidate earlier images. The parent's current rcParams are hashed too,
+    since forked workers inherit them when ``style`` is None.
+
+    Args:
+        name (str): Plot function name
+        kwargs (dict): Keyword arguments of the call
+        style (str, optional): Matplotlib style the figure is rendered with
+
+    Returns:
+        str: Hex digest identifying the rendered figure
+    """
+    bound = inspect.signature(_PLOTTERS[name]).bind(**kwargs)
+    bound.apply_defaults()
+
+    digest = hashlib.sha1(repr((name, style, matplotlib.__version__)).encode())
+    digest.update(repr(sorted(plt.rcParams.items())).encode())
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    for key, value in bound.arguments.items():
+        digest.update(key.encode())
+        if isinstance(value, (pd.Series, pd.DataFrame)):
+            labels = value.columns if isinstance(value, pd.DataFrame) else [value.name]
+            digest.update(repr(list(labels)).encode())
+            digest.update(pd.util.hash_pandas_object(value, index=True).to_numpy().tobytes())
+        else:
+            digest.update(repr(value).encode())
+    return digest.hexdigest()
+
+
+def _is_unchanged(save_path, sig):
+    """Check whether save_path exists and was rendered from the same signature."""
+    try:
+        with open(f'{save_path}.sig') as f:
+            return f.read() == sig and os.path.exists(save_path)
+    except OSError:
+        return False
+
+
+def _init_worker(style):
+    """Enable figure pooling in a render_all worker and apply the plot style."""
+    global _USE_FIGURE_POOL
+    _USE_FIGURE_POOL = True
+    if style:
+        set_plot_style(style)
+
+
+def _render_payload(name, kwargs):
+    """Build and save one figure in a worker process, reusing pooled figures."""
+    _PLOTTERS[name](**kwargs)
+
+
+def render_all(payloads, max_workers=None, style=None, skip_unchanged=False):
+    """
+    Render several report figures in parallel worker processes.
+
+    Each figure is built and saved independently, so the savefig encoding of
+    all figures overlaps across cores. Workers reuse one figure per figsize
+    across the plots they render; figures are not returned.
+
+    With skip_unchanged, a content signature of each call is stored next to
+    its image as ``<save_path>.sig``, and calls whose data, arguments and
+    style match the stored signature are not re-rendered.
+
+    Args:
+        payloads (list): (plot function name, keyword arguments) tuples, e.g.
+            [('plot_species', {'top_species': top_species})]
+        max_workers (int, optional): Number of worker processes (default: CPU count)
+        style (str, optional): Matplotlib style applied in each worker via set_plot_style
+        skip_unchanged (bool): Skip figures whose saved image is up to date
+
+    Returns:
+        list: Save path of each figure, in payload order
+    """
+    for name, _ in payloads:
+        if name not in _PLOTTERS:
+            raise ValueError(f"Unknown plot function: {name!r}")
+
+    save_paths = [_resolve_save_path(name, kwargs) for name, kwargs in payloads]
+    sigs = [None] * len(payloads)
+    if skip_unchanged:
+        sigs = [_fig_sig(name, kwargs, style) if path else None
+                for (name, kwargs), path in zip(payloads, save_paths)]
+
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(style,)) as executor:
+        futures = {}
+        for i, (name, kwargs) in enumerate(payloads):
+            if sigs[i] and _is_unchanged(save_paths[i], sigs[i]):
+                continue
+            futures[i] = executor.submit(_render_payload, name, kwargs)
+
+        for i, future in futures.items():
+            future.result()
+            if sigs[i]:
+                with open(f'{save_paths[i]}.sig', 'w') as f:
+                    f.write(sigs[i])
+            elif save_paths[i] and os.path.exists(f'{save_paths[i]}.sig'):
+                # The image was re-rendered without a signature, so drop the stale one
+                os.remove(f'{save_paths[i]}.sig')
+
+    return save_paths